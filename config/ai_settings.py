@@ -65,4 +65,10 @@ AI_PROMPTS = {
 AI_SETTINGS = {
     "max_code_length": 60000,
     "enable_cache": True
-}
\ No newline at end of file
+}
+
+DEOBFUSCATION_SETTINGS = {
+    "enable": True,
+    "time_budget": 10,                  # 单个脚本反混淆最长耗时(秒)，超时返回已完成阶段结果
+    "max_script_size": 5 * 1024 * 1024  # 超过该长度的脚本跳过反混淆
+}
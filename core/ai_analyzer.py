@@ -12,6 +12,7 @@ from config.log_config import configure_logger
 
 from config.ai_settings import AI_PROMPTS, AI_SETTINGS, DEEPSEEK_API, AI_STRATEGY
 from core.cache_manager import AnalysisCache
+from core.deobfuscator import Deobfuscator
 
 class AIAnalyzer:
     def __init__(self):
@@ -23,6 +24,7 @@ class AIAnalyzer:
         self.logger = configure_logger('AI分析器')
         self.logger.info(f"AI服务初始化完成，启用状态: {self.enabled}")
         self.cache = AnalysisCache()
+        self.deobfuscator = Deobfuscator()
         self.logger.info("AI服务状态: %s", "已启用" if self.enabled else "已禁用")
         if self.enabled and not self.api_key.startswith("sk-"):
             print("[警告] API密钥格式可能不正确")
@@ -35,14 +37,19 @@ class AIAnalyzer:
             print(e)
             return {}
 
-    def analyze_code(self, code: str) -> Dict:  # 统一入口参数
+    def analyze_code(self, code: str, deobfuscate: bool = True) -> Dict:  # 统一入口参数
         result = {
             "algorithm_analysis": {"ai": {}, "local": []},
             "key_analysis": {},
             "custom_analysis": {},
+            "deobfuscation": {},
             "errors": []
         }
 
+        # 反混淆预处理：还原字符串数组后再做特征匹配，同时缩短提交给API的代码
+        if deobfuscate:
+            code, result["deobfuscation"] = self.deobfuscator.deobfuscate(code)
+
         # 本地特征分析
         try:
             result["algorithm_analysis"]["local"] = self._match_local_features(code)
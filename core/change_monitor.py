@@ -0,0 +1,106 @@
+# core/change_monitor.py
+import re
+import json
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Union
+from urllib.parse import urlparse
+from config.log_config import configure_logger
+
+
+class SnapshotStore:
+    """按站点保存脚本快照（URL、ETag/Last-Modified、内容哈希、本地特征）"""
+
+    def __init__(self, snapshot_dir: Union[str, Path] = None):
+        self.snapshot_dir = Path(snapshot_dir) if snapshot_dir else Path(__file__).parent.parent / "snapshots"
+        self.snapshot_dir.mkdir(exist_ok=True)
+        self.logger = configure_logger('快照存储')
+
+    def _path_for(self, url: str) -> Path:
+        host = urlparse(url).hostname or "local"
+        digest = hashlib.sha256(url.encode('utf-8')).hexdigest()[:12]
+        return self.snapshot_dir / f"{host}_{digest}.json"
+
+    def load(self, url: str) -> Dict:
+        path = self._path_for(url)
+        if not path.exists():
+            return {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning("快照读取失败，按首次扫描处理 文件: %s 错误: %s", path, str(e))
+            return {}
+
+    def save(self, url: str, snapshot: Dict) -> None:
+        path = self._path_for(url)
+        # 先写临时文件再替换，避免中断导致快照损坏
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False, indent=2)
+        tmp_path.replace(path)
+        self.logger.debug("快照已保存 文件: %s", path)
+
+
+class ChangeMonitor:
+    """监控模式：仅对新增或变化的脚本进行分析，输出加密特征变化报告"""
+
+    def __init__(self, extractor, analyzer, store: SnapshotStore = None):
+        self.extractor = extractor
+        self.analyzer = analyzer
+        self.store = store or SnapshotStore()
+        self.logger = configure_logger('变更监控')
+
+    def run(self, url: str) -> Dict:
+        old_snapshot = self.store.load(url)
+        new_snapshot, changed = self.extractor.extract_changes(url, old_snapshot)
+
+        # 变化脚本逐个反混淆并做本地特征匹配，便于后续按脚本对比
+        deobfuscation = []
+        for script_id, code in changed.items():
+            code, stats = self.analyzer.deobfuscator.deobfuscate(code)
+            deobfuscation.append(stats)
+            changed[script_id] = code
+            findings = self.analyzer._match_local_features(code)
+            new_snapshot["scripts"][script_id]["findings"] = sorted({
+                f"{f['category']}/{f['algorithm']}" for f in findings
+            })
+
+        old_scripts = old_snapshot.get("scripts", {})
+        new_scripts = new_snapshot["scripts"]
+        old_algorithms = self._collect_algorithms(old_scripts)
+        new_algorithms = self._collect_algorithms(new_scripts)
+
+        report = {
+            "url": url,
+            "first_scan": not old_snapshot,
+            "last_scan": old_snapshot.get("updated_at"),
+            "changed_scripts": sorted(sid for sid in changed if sid in old_scripts),
+            "new_scripts": sorted(sid for sid in changed if sid not in old_scripts),
+            "removed_scripts": sorted(set(old_scripts) - set(new_scripts)),
+            "added_algorithms": sorted(new_algorithms - old_algorithms),
+            "removed_algorithms": sorted(old_algorithms - new_algorithms),
+            "requests": new_snapshot.pop("stats"),
+            "deobfuscation": self.analyzer.deobfuscator.merge_stats(deobfuscation),
+            "ai_analysis": None
+        }
+
+        # 无变化时跳过AI分析，不产生API调用
+        if changed:
+            code = re.sub(r'\s+', ' ', '\n'.join(changed.values())).strip()
+            report["ai_analysis"] = self.analyzer.analyze_code(code, deobfuscate=False)
+            report["ai_analysis"]["deobfuscation"] = report["deobfuscation"]
+        else:
+            self.logger.info("未检测到脚本变化，跳过AI分析 URL: %s", url)
+
+        new_snapshot["updated_at"] = datetime.now().isoformat(timespec='seconds')
+        self.store.save(url, new_snapshot)
+        return report
+
+    @staticmethod
+    def _collect_algorithms(scripts: Dict) -> set:
+        algorithms = set()
+        for entry in scripts.values():
+            algorithms.update(entry.get("findings", []))
+        return algorithms
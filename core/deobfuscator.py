@@ -0,0 +1,1058 @@
+# core/deobfuscator.py
+import re
+import ast
+import math
+import base64
+from time import monotonic
+from functools import lru_cache
+from typing import Dict, List, Tuple, Union
+from config.ai_settings import DEOBFUSCATION_SETTINGS
+from config.log_config import configure_logger
+
+# obfuscator.io 自带的base64字母表（小写在前）
+_OBF_ALPHABET = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789+/='
+
+_SPACE_RE = re.compile(r'(?:\s+|//[^\n]*|/\*.*?\*/)+', re.S)
+_TOKEN_RE = re.compile(r'''
+    (?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+   |(?P<template>`(?:[^`\\]|\\.)*`)
+   |(?P<number>0[xX][0-9a-fA-F_]+n?|0[oO][0-7_]+n?|0[bB][01_]+n?|(?:\d[\d_]*\.?[\d_]*|\.\d+)(?:[eE][+-]?\d+)?n?)
+   |(?P<ident>(?:[^\W\d]|\$|\\u[0-9a-fA-F]{4})(?:[\w$]|\\u[0-9a-fA-F]{4})*)
+   |(?P<punct>>>>=|\.\.\.|===|!==|\*\*=|<<=|>>=|>>>|&&=|\|\|=|\?\?=|=>|==|!=|<=|>=|&&|\|\||\?\?|\?\.(?!\d)
+      |\+\+|--|\*\*|<<|>>|[-+*/%&|^]=|[{}()\[\];,<>+\-*/%&|^!~?:=.@\#])
+''', re.X | re.S)
+_REGEX_RE = re.compile(r'/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*')
+_ESCAPE_RE = re.compile(r'\\(?:x([0-9a-fA-F]{2})|u\{([0-9a-fA-F]+)\}|u([0-9a-fA-F]{4})|([0-7]{1,3})|(\r\n|[\s\S]))')
+_DECIMAL_RE = re.compile(r'(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+_IDENT_NAME_RE = re.compile(r'[A-Za-z_$][\w$]*')
+
+_KEYWORDS = {
+    'break', 'case', 'catch', 'class', 'const', 'continue', 'debugger', 'default', 'delete',
+    'do', 'else', 'export', 'extends', 'finally', 'for', 'function', 'if', 'import', 'in',
+    'instanceof', 'let', 'new', 'return', 'super', 'switch', 'this', 'throw', 'try',
+    'typeof', 'var', 'void', 'while', 'with', 'yield', 'await', 'true', 'false', 'null'
+}
+# 这些关键字之后的 / 是正则字面量而非除号
+_REGEX_PREFIX_KEYWORDS = {
+    'return', 'typeof', 'case', 'do', 'else', 'in', 'instanceof', 'new', 'void',
+    'delete', 'throw', 'yield', 'await'
+}
+_DECLARE_KEYWORDS = {'var', 'let', 'const'}
+# 这些标识符之后的 [ 是数组字面量而非成员访问
+_NOT_MEMBER_PREV = (_KEYWORDS | {'of', 'async'}) - {'this', 'super'}
+_SIMPLE_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v'}
+_QUOTE_ESCAPES = {'\n': '\\n', '\t': '\\t', '\r': '\\r', '\b': '\\b', '\f': '\\f', '\v': '\\v'}
+
+# 常量折叠的上下文约束：左侧必须是优先级低于运算的分隔符，右侧不能紧跟更高优先级的运算
+_FOLD_PREV = {
+    '(', '[', '{', '}', ',', ';', ':', '?', '=', '=>', '==', '!=', '===', '!==',
+    '<', '>', '<=', '>=', '&&', '||', '??', 'return', 'case'
+}
+_COMPARE_PREV = {'(', '[', '{', '}', ',', ';', ':', '?', '=', '=>', '&&', '||', '??', 'return', 'case'}
+_FOLD_REJECT_NEXT = {'*', '/', '%', '**', '.', '[', '(', '?.', '++', '--'}
+_COMPARE_REJECT_NEXT = _FOLD_REJECT_NEXT | {
+    '+', '-', '<', '>', '<=', '>=', '==', '!=', '===', '!==', 'in', 'instanceof'
+}
+_ARITH_OPS = {'+', '-', '*', '/', '%'}
+_FOLD_START = {'!', '(', '-', '+'}
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+class _Token:
+    __slots__ = ('kind', 'value', 'prefix')
+
+    def __init__(self, kind: str, value: str, prefix: str = ''):
+        self.kind = kind
+        self.value = value
+        self.prefix = prefix
+
+    def __repr__(self):
+        return f"_Token({self.kind!r}, {self.value!r})"
+
+
+def _js_unescape(body: str) -> str:
+    """按JS语义解码字符串字面量中的转义序列"""
+    if '\\' not in body:
+        return body
+
+    def replace(m):
+        hex2, brace, hex4, octal, other = m.groups()
+        if hex2:
+            return chr(int(hex2, 16))
+        if brace:
+            return chr(int(brace, 16))
+        if hex4:
+            return chr(int(hex4, 16))
+        if octal:
+            if int(octal, 8) > 255:
+                return chr(int(octal[:2], 8)) + octal[2]
+            return chr(int(octal, 8))
+        if other in ('\n', '\r', '\r\n', '\u2028', '\u2029'):
+            return ''
+        return _SIMPLE_ESCAPES.get(other, other)
+    return _ESCAPE_RE.sub(replace, body)
+
+
+def _js_quote(value: str) -> str:
+    quote = "'" if "'" not in value or '"' in value else '"'
+    out = []
+    for ch in value:
+        code = ord(ch)
+        if ch == quote or ch == '\\':
+            out.append('\\' + ch)
+        elif ch in _QUOTE_ESCAPES:
+            out.append(_QUOTE_ESCAPES[ch])
+        elif code < 0x20 or 0x7f <= code < 0xa0:
+            out.append(f'\\x{code:02x}')
+        elif ch in '\u2028\u2029' or 0xd800 <= code <= 0xdfff:
+            out.append(f'\\u{code:04x}')
+        elif code > 0xffff:
+            high, low = divmod(code - 0x10000, 0x400)
+            out.append(f'\\u{0xd800 + high:04x}\\u{0xdc00 + low:04x}')
+        else:
+            out.append(ch)
+    return quote + ''.join(out) + quote
+
+
+def _merge_surrogates(value: str) -> str:
+    try:
+        return value.encode('utf-16', 'surrogatepass').decode('utf-16')
+    except UnicodeDecodeError:
+        return value
+
+
+def _js_to_number(value: str) -> float:
+    value = value.strip()
+    if not value:
+        return 0.0
+    try:
+        if value[:2].lower() == '0x':
+            return float(int(value, 16))
+        return float(value)
+    except ValueError:
+        return math.nan
+
+
+def _js_parse_int(value: str) -> float:
+    m = re.match(r'\s*([+-]?)(?:(0[xX])([0-9a-fA-F]+)|(\d+))', value)
+    if not m:
+        return math.nan
+    sign, _, hex_digits, digits = m.groups()
+    number = int(hex_digits, 16) if hex_digits else int(digits)
+    return float(-number if sign == '-' else number)
+
+
+def _format_number(value: float) -> Union[str, None]:
+    if math.isnan(value) or math.isinf(value):
+        return None
+    if value == int(value) and abs(value) < 2 ** 53:
+        return str(int(value))
+    return repr(value)
+
+
+def _eval_arith(node) -> float:
+    """按JS浮点语义计算仅含数字与四则/取模运算的表达式"""
+    if isinstance(node, ast.Expression):
+        return _eval_arith(node.body)
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return float(node.value)
+    if isinstance(node, ast.Name) and node.id == 'nan':
+        return math.nan
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        operand = _eval_arith(node.operand)
+        return -operand if isinstance(node.op, ast.USub) else operand
+    if isinstance(node, ast.BinOp):
+        left, right = _eval_arith(node.left), _eval_arith(node.right)
+        if isinstance(node.op, ast.Add):
+            return left + right
+        if isinstance(node.op, ast.Sub):
+            return left - right
+        if isinstance(node.op, ast.Mult):
+            return left * right
+        if isinstance(node.op, ast.Div):
+            if right == 0:
+                if left == 0 or math.isnan(left):
+                    return math.nan
+                return math.copysign(math.inf, left) * math.copysign(1, right)
+            return left / right
+        if isinstance(node.op, ast.Mod):
+            if right == 0 or math.isinf(left):
+                return math.nan
+            return math.fmod(left, right)
+    raise ValueError(f"不支持的表达式节点: {type(node).__name__}")
+
+
+def _utf8_or_raw(raw: str) -> str:
+    try:
+        return raw.encode('latin-1').decode('utf-8')
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        return raw
+
+
+@lru_cache(maxsize=8192)
+def _obf_base64_raw(data: str) -> str:
+    cleaned = data.swapcase().rstrip('=')
+    cleaned = cleaned[:len(cleaned) - len(cleaned) % 4] if len(cleaned) % 4 == 1 else cleaned
+    decoded = base64.b64decode(cleaned + '=' * (-len(cleaned) % 4))
+    return decoded.decode('latin-1')
+
+
+@lru_cache(maxsize=8192)
+def _decode_base64(data: str) -> str:
+    return _utf8_or_raw(_obf_base64_raw(data))
+
+
+@lru_cache(maxsize=8192)
+def _decode_rc4(data: str, key: str) -> str:
+    raw = _obf_base64_raw(data)
+    state = list(range(256))
+    j = 0
+    for i in range(256):
+        j = (j + state[i] + ord(key[i % len(key)])) % 256
+        state[i], state[j] = state[j], state[i]
+    i = j = 0
+    out = []
+    for ch in raw:
+        i = (i + 1) % 256
+        j = (j + state[i]) % 256
+        state[i], state[j] = state[j], state[i]
+        out.append(chr(ord(ch) ^ state[(state[i] + state[j]) % 256]))
+    return _utf8_or_raw(''.join(out))
+
+
+class Deobfuscator:
+    """纯Python静态反混淆：解码字符串数组、折叠常量、还原转义字面量并删除死代码
+
+    面向 obfuscator.io 风格代码，不执行任何脚本；超出时间/长度预算时返回已完成阶段的结果
+    """
+
+    MAX_PASSES = 8
+
+    def __init__(self, settings: Dict = None):
+        settings = {**DEOBFUSCATION_SETTINGS, **(settings or {})}
+        self.enabled = settings["enable"]
+        self.time_budget = settings["time_budget"]
+        self.max_script_size = settings["max_script_size"]
+        self.logger = configure_logger('反混淆')
+
+    def deobfuscate(self, code: str) -> Tuple[str, Dict]:
+        """返回 (处理后代码, 统计信息)"""
+        stats = {
+            "status": "ok",
+            "original_length": len(code),
+            "result_length": len(code),
+            "strings_decoded": 0,
+            "literals_unescaped": 0,
+            "constants_folded": 0,
+            "dead_branches": 0,
+            "elapsed": 0.0
+        }
+        if not self.enabled:
+            stats["status"] = "disabled"
+            return code, stats
+        if not code:
+            return code, stats
+        if len(code) > self.max_script_size:
+            stats["status"] = "skipped"
+            self.logger.info("脚本超出反混淆长度预算，跳过 长度: %d", len(code))
+            return code, stats
+
+        started = monotonic()
+        deadline = started + self.time_budget
+        result = code
+        tokens = None
+        try:
+            tokens = self._tokenize(code, deadline)
+            stats["literals_unescaped"] = self._normalize_literals(tokens)
+            steps = (
+                (self._fold_constants, "constants_folded"),
+                (self._decode_string_arrays, "strings_decoded"),
+                (self._normalize_members, None),
+                (self._drop_dead_code, "dead_branches"),
+            )
+            for _ in range(self.MAX_PASSES):
+                changed = False
+                for step, counter in steps:
+                    self._check_deadline(deadline)
+                    tokens, count = step(tokens, deadline)
+                    if counter:
+                        stats[counter] += count
+                    changed = changed or count > 0
+                if not changed:
+                    break
+            result = self._render(tokens)
+            # 未解码字符串也未删除分支时输出不应明显变短，否则视为词法分析失真
+            if not stats["strings_decoded"] and not stats["dead_branches"] \
+                    and self._code_size(result) < self._code_size(code) * 0.5:
+                stats["status"] = "rejected"
+                result = code
+                self.logger.warning("反混淆结果丢失大部分内容，使用原始代码")
+        except _BudgetExceeded:
+            stats["status"] = "budget_exceeded"
+            result = self._render(tokens) if tokens is not None else code
+            self.logger.warning("反混淆超出时间预算 %.1fs，返回部分结果", self.time_budget)
+        except Exception as e:
+            stats["status"] = "error"
+            result = code
+            self.logger.warning("反混淆失败，使用原始代码: %s", str(e), exc_info=True)
+
+        stats["result_length"] = len(result)
+        stats["elapsed"] = round(monotonic() - started, 3)
+        self.logger.info(
+            "反混淆完成 长度: %d -> %d 解码字符串: %d 折叠常量: %d 删除死分支: %d 耗时: %.2fs",
+            stats["original_length"], stats["result_length"], stats["strings_decoded"],
+            stats["constants_folded"], stats["dead_branches"], stats["elapsed"]
+        )
+        return result, stats
+
+    @staticmethod
+    def merge_stats(stats_list: List[Dict]) -> Dict:
+        """汇总多个脚本的统计：长度与计数累加，状态按类别计数"""
+        merged = {
+            "scripts": len(stats_list),
+            "status": {},
+            "original_length": 0,
+            "result_length": 0,
+            "strings_decoded": 0,
+            "literals_unescaped": 0,
+            "constants_folded": 0,
+            "dead_branches": 0,
+            "elapsed": 0.0
+        }
+        for stats in stats_list:
+            merged["status"][stats["status"]] = merged["status"].get(stats["status"], 0) + 1
+            for key in ("original_length", "result_length", "strings_decoded",
+                        "literals_unescaped", "constants_folded", "dead_branches", "elapsed"):
+                merged[key] += stats[key]
+        merged["elapsed"] = round(merged["elapsed"], 3)
+        return merged
+
+    @staticmethod
+    def _code_size(code: str) -> int:
+        return len(re.sub(r'\s+', '', code))
+
+    @staticmethod
+    def _check_deadline(deadline: float) -> None:
+        if monotonic() > deadline:
+            raise _BudgetExceeded()
+
+    # ----------------- 词法分析与输出 -----------------
+
+    def _tokenize(self, code: str, deadline: float) -> List[_Token]:
+        tokens = []
+        pos, length = 0, len(code)
+        prefix = ''
+        while pos < length:
+            if len(tokens) % 5000 == 0:
+                self._check_deadline(deadline)
+            space = _SPACE_RE.match(code, pos)
+            if space:
+                prefix = re.sub(r'\s+', lambda m: '\n' if '\n' in m.group() else ' ', space.group())
+                pos = space.end()
+                continue
+            prev = tokens[-1] if tokens else None
+            if code[pos] == '/' and self._regex_allowed(prev) and not self._is_property_name(tokens, len(tokens) - 1):
+                match = _REGEX_RE.match(code, pos)
+                if match:
+                    tokens.append(_Token('regex', match.group(), prefix))
+                    pos, prefix = match.end(), ''
+                    continue
+            match = _TOKEN_RE.match(code, pos)
+            if match:
+                tokens.append(_Token(match.lastgroup, match.group(), prefix))
+                pos = match.end()
+            else:
+                # 未闭合字符串等无法识别的字符原样保留
+                tokens.append(_Token('punct', code[pos], prefix))
+                pos += 1
+            prefix = ''
+        if prefix.strip():
+            # 末尾注释保留在占位单元上；整段代码被压成一行时 // 注释会吞掉其后全部内容
+            tokens.append(_Token('eof', '', prefix))
+        return tokens
+
+    @staticmethod
+    def _regex_allowed(prev: Union[_Token, None]) -> bool:
+        if prev is None:
+            return True
+        if prev.kind == 'punct':
+            return prev.value not in (')', ']', '}')
+        return prev.kind == 'ident' and prev.value in _REGEX_PREFIX_KEYWORDS
+
+    @staticmethod
+    def _is_property_name(tokens: List[_Token], i: int) -> bool:
+        """o.return、o?.case 中的关键字是属性名"""
+        return i > 0 and tokens[i - 1].value in ('.', '?.')
+
+    @staticmethod
+    def _render(tokens: List[_Token]) -> str:
+        out = []
+        prev = ''
+        for tok in tokens:
+            sep = tok.prefix
+            if not sep and prev:
+                last, first = prev[-1], tok.value[0]
+                if ((last.isalnum() or last in '_$\\') and (first.isalnum() or first in '_$\\')) \
+                        or (last in '+-' and first == last) \
+                        or (last == '/' and first in '/*') \
+                        or (prev.isdigit() and tok.value == '.'):
+                    sep = ' '
+            out.append(sep)
+            out.append(tok.value)
+            prev = tok.value or prev
+        return ''.join(out).strip()
+
+    @staticmethod
+    def _match_brackets(tokens: List[_Token]) -> List[int]:
+        pairs = {')': '(', ']': '[', '}': '{'}
+        matches = [-1] * len(tokens)
+        stack = []
+        for i, tok in enumerate(tokens):
+            if tok.kind != 'punct':
+                continue
+            if tok.value in ('(', '[', '{'):
+                stack.append(i)
+            elif tok.value in pairs:
+                if stack and tokens[stack[-1]].value == pairs[tok.value]:
+                    j = stack.pop()
+                    matches[i], matches[j] = j, i
+        return matches
+
+    # ----------------- 字面量还原 -----------------
+
+    def _normalize_literals(self, tokens: List[_Token]) -> int:
+        """解码转义字符串、十六进制数字与转义标识符"""
+        count = 0
+        for tok in tokens:
+            if tok.kind == 'string' and '\\' in tok.value:
+                value = _merge_surrogates(_js_unescape(tok.value[1:-1]))
+                if any(0xd800 <= ord(ch) <= 0xdfff for ch in value):
+                    continue
+                quoted = _js_quote(value)
+                if quoted != tok.value:
+                    tok.value = quoted
+                    count += 1
+            elif tok.kind == 'number' and tok.value[:2].lower() in ('0x', '0o', '0b') \
+                    and '_' not in tok.value and not tok.value.endswith('n'):
+                tok.value = str(int(tok.value, 0))
+            elif tok.kind == 'ident' and '\\u' in tok.value:
+                value = _js_unescape(tok.value)
+                if re.fullmatch(r'(?:[^\W\d]|\$)[\w$]*', value) and value not in _KEYWORDS:
+                    tok.value = value
+                    count += 1
+        return count
+
+    @staticmethod
+    def _string_value(tok: _Token) -> str:
+        return _js_unescape(tok.value[1:-1])
+
+    @staticmethod
+    def _is_decimal(tok: _Token) -> bool:
+        return tok.kind == 'number' and bool(_DECIMAL_RE.fullmatch(tok.value))
+
+    def _normalize_members(self, tokens: List[_Token], deadline: float) -> Tuple[List[_Token], int]:
+        """obj['encrypt'] -> obj.encrypt，便于本地特征正则命中"""
+        out = []
+        count = 0
+        i, length = 0, len(tokens)
+        while i < length:
+            tok = tokens[i]
+            prev = out[-1] if out else None
+            if tok.value == '[' and i + 2 < length and tokens[i + 1].kind == 'string' \
+                    and tokens[i + 2].value == ']' and prev is not None \
+                    and (prev.value in (')', ']') or (prev.kind == 'ident' and prev.value not in _NOT_MEMBER_PREV)) \
+                    and not self._is_computed_key(prev, tokens, i):
+                name = self._string_value(tokens[i + 1])
+                if _IDENT_NAME_RE.fullmatch(name):
+                    out.append(_Token('punct', '.', tok.prefix))
+                    out.append(_Token('ident', name))
+                    count += 1
+                    i += 3
+                    continue
+            out.append(tok)
+            i += 1
+        return out, count
+
+    @staticmethod
+    def _is_computed_key(prev: _Token, tokens: List[_Token], i: int) -> bool:
+        """get ['x']() {}、static ['y'] = 1 中的方括号是计算属性名，不能改写为 .x"""
+        if prev.value == 'static':
+            return True
+        return prev.value in ('get', 'set') and i + 3 < len(tokens) and tokens[i + 3].value == '('
+
+    # ----------------- 常量折叠 -----------------
+
+    def _fold_constants(self, tokens: List[_Token], deadline: float) -> Tuple[List[_Token], int]:
+        out = []
+        count = 0
+        i, length = 0, len(tokens)
+        while i < length:
+            if i % 5000 == 0:
+                self._check_deadline(deadline)
+            tok = tokens[i]
+            if tok.value not in _FOLD_START and tok.kind not in ('string', 'number'):
+                out.append(tok)
+                i += 1
+                continue
+            prev = out[-1].value if out else ';'
+            prev_kind = out[-1].kind if out else 'punct'
+            if prev_kind == 'ident' and self._is_property_name(out, len(out) - 1):
+                # o.return + 1 * 2 中的 return 不是关键字，不能作为折叠左边界
+                prev = None
+            # 一元 + 之后不能做字符串拼接折叠：+'1' + '2' 结果为字符串 '12'
+            binary_plus = prev == '+' and len(out) > 1 and self._is_operand(out[-2])
+            folded = (
+                self._fold_booleans(tokens, i)
+                or (prev_kind == 'punct' and prev not in (')', ']', '}') and self._fold_parens(tokens, i))
+                or (prev in _COMPARE_PREV and self._fold_comparison(tokens, i))
+                or ((prev in _FOLD_PREV or binary_plus) and self._fold_concat(tokens, i))
+                or (prev in _FOLD_PREV and self._fold_arithmetic(tokens, i))
+            )
+            if folded:
+                new_tokens, end = folded
+                new_tokens[0].prefix = tok.prefix
+                out.extend(new_tokens)
+                count += 1
+                i = end
+                continue
+            out.append(tok)
+            i += 1
+        return out, count
+
+    @staticmethod
+    def _is_operand(tok: _Token) -> bool:
+        if tok.kind in ('number', 'string', 'template', 'regex'):
+            return True
+        if tok.kind == 'ident':
+            return tok.value not in _NOT_MEMBER_PREV
+        return tok.value in (')', ']')
+
+    @staticmethod
+    def _fold_booleans(tokens: List[_Token], i: int):
+        """!![] -> true, ![] -> false, !true -> false"""
+        if tokens[i].value != '!':
+            return None
+        values = [t.value for t in tokens[i:i + 5]]
+        # ![].length 等价于 !([].length)，不能折叠
+        if values[:4] == ['!', '!', '[', ']'] and (len(values) < 5 or values[4] not in _FOLD_REJECT_NEXT):
+            return [_Token('ident', 'true')], i + 4
+        if values[:3] == ['!', '[', ']'] and (len(values) < 4 or values[3] not in _FOLD_REJECT_NEXT):
+            return [_Token('ident', 'false')], i + 3
+        if values[:1] == ['!'] and len(values) > 1 and tokens[i + 1].kind == 'ident' \
+                and values[1] in ('true', 'false') and (len(values) < 3 or values[2] not in ('.', '[')):
+            return [_Token('ident', 'false' if values[1] == 'true' else 'true')], i + 2
+        return None
+
+    @staticmethod
+    def _fold_parens(tokens: List[_Token], i: int):
+        """'k' + (28) -> 'k' + 28"""
+        if i + 2 >= len(tokens) or tokens[i].value != '(' or tokens[i + 2].value != ')':
+            return None
+        inner = tokens[i + 1]
+        if not (inner.kind in ('number', 'string') or inner.value in ('true', 'false', 'null')):
+            return None
+        if i + 3 < len(tokens) and tokens[i + 3].value in _FOLD_REJECT_NEXT | {'=>', '`'}:
+            return None
+        return [_Token(inner.kind, inner.value)], i + 3
+
+    def _fold_comparison(self, tokens: List[_Token], i: int):
+        if i + 2 >= len(tokens) or tokens[i + 1].value not in ('===', '!==', '==', '!='):
+            return None
+        left, right = tokens[i], tokens[i + 2]
+        if i + 3 < len(tokens) and tokens[i + 3].value in _COMPARE_REJECT_NEXT:
+            return None
+        if left.kind == 'string' and right.kind == 'string':
+            equal = self._string_value(left) == self._string_value(right)
+        elif self._is_decimal(left) and self._is_decimal(right):
+            equal = float(left.value) == float(right.value)
+        else:
+            return None
+        result = equal if tokens[i + 1].value in ('===', '==') else not equal
+        return [_Token('ident', 'true' if result else 'false')], i + 3
+
+    def _fold_concat(self, tokens: List[_Token], i: int):
+        if tokens[i].kind != 'string':
+            return None
+        parts = [self._string_value(tokens[i])]
+        j = i + 1
+        while j + 1 < len(tokens) and tokens[j].value == '+' and tokens[j + 1].kind == 'string':
+            parts.append(self._string_value(tokens[j + 1]))
+            j += 2
+        # 右侧紧跟更高优先级运算时，最后一个字符串不能参与拼接
+        if j < len(tokens) and tokens[j].value in _FOLD_REJECT_NEXT | {'`'}:
+            parts.pop()
+            j -= 2
+        if len(parts) < 2:
+            return None
+        return [_Token('string', _js_quote(''.join(parts)))], j
+
+    def _fold_arithmetic(self, tokens: List[_Token], i: int):
+        first = tokens[i]
+        if not (self._is_decimal(first) or first.value in ('(', '-', '+')):
+            return None
+        j, depth, end = i, 0, None
+        while j < len(tokens):
+            tok = tokens[j]
+            if tok.value == '(':
+                depth += 1
+            elif tok.value == ')':
+                if depth == 0:
+                    break
+                depth -= 1
+            elif not (self._is_decimal(tok) or tok.value in _ARITH_OPS):
+                break
+            j += 1
+            if depth == 0 and (self._is_decimal(tok) or tok.value == ')'):
+                end = j
+        if end is None or end - i < 2:
+            return None
+        if end < len(tokens) and tokens[end].value in _FOLD_REJECT_NEXT:
+            return None
+        span = tokens[i:end]
+        if not any(self._is_decimal(t) for t in span):
+            return None
+        try:
+            value = _eval_arith(ast.parse(' '.join(t.value for t in span), mode='eval'))
+        except (SyntaxError, ValueError, RecursionError):
+            return None
+        text = _format_number(value)
+        if text is None or text == ''.join(t.value for t in span):
+            return None
+        if text.startswith('-'):
+            return [_Token('punct', '-'), _Token('number', text[1:])], end
+        return [_Token('number', text)], end
+
+    # ----------------- 字符串数组解码 -----------------
+
+    def _decode_string_arrays(self, tokens: List[_Token], deadline: float) -> Tuple[List[_Token], int]:
+        total = 0
+        attempted = set()
+        while True:
+            tokens, count, name = self._decode_next_array(tokens, deadline, attempted)
+            if name is None:
+                return tokens, total
+            attempted.add(name)
+            total += count
+
+    def _decode_next_array(self, tokens, deadline, attempted):
+        """处理下一个尚未尝试的字符串数组，返回 (词法单元, 解码数量, 数组名)"""
+        matches = self._match_brackets(tokens)
+        for array in self._find_string_arrays(tokens, matches):
+            if array["name"] in attempted:
+                continue
+            self._check_deadline(deadline)
+            decoders = self._find_decoders(tokens, matches, array)
+            if not decoders:
+                attempted.add(array["name"])
+                continue
+            aliases = self._find_aliases(tokens, decoders)
+            rotation = self._find_rotation(tokens, matches, array, decoders, aliases, deadline)
+            if rotation is None:
+                attempted.add(array["name"])
+                continue
+            values, iife_span = rotation
+            # 普通业务数组不做内联：必须带有轮转自执行函数或新版数组包装函数
+            if iife_span is None and not array["wrapper"]:
+                attempted.add(array["name"])
+                continue
+            tokens, count = self._inline_decoder_calls(tokens, matches, array, decoders, aliases, values, iife_span)
+            return tokens, count, array["name"]
+        return tokens, 0, None
+
+    def _find_string_arrays(self, tokens: List[_Token], matches: List[int]) -> List[Dict]:
+        arrays = []
+        length = len(tokens)
+        covered_until = -1
+        for i in range(length - 4):
+            if i <= covered_until:
+                continue
+            tok = tokens[i]
+            # 新版: function NAME(){ const X = [...]; NAME = function(){ return X; }; return NAME(); }
+            if tok.value == 'function' and tokens[i + 1].kind == 'ident' \
+                    and [t.value for t in tokens[i + 2:i + 5]] == ['(', ')', '{']:
+                body_end = matches[i + 4]
+                values = self._parse_array_decl(tokens, matches, i + 5)
+                if values and body_end > 0:
+                    body = [t.value for t in tokens[i + 5:body_end]]
+                    if tokens[i + 1].value in body and 'return' in body:
+                        arrays.append({
+                            "name": tokens[i + 1].value, "values": values, "span": (i, body_end), "wrapper": True
+                        })
+                        covered_until = body_end
+                continue
+            # 旧版: var NAME = [...];
+            if tok.value in _DECLARE_KEYWORDS and tokens[i + 1].kind == 'ident':
+                values = self._parse_array_decl(tokens, matches, i)
+                if values:
+                    end = matches[i + 3]
+                    if end + 1 < length and tokens[end + 1].value == ';':
+                        arrays.append({
+                            "name": tokens[i + 1].value, "values": values, "span": (i, end + 1), "wrapper": False
+                        })
+                        covered_until = end + 1
+        return arrays
+
+    def _parse_array_decl(self, tokens: List[_Token], matches: List[int], i: int) -> Union[List[str], None]:
+        if i + 3 >= len(tokens) or tokens[i].value not in _DECLARE_KEYWORDS \
+                or tokens[i + 1].kind != 'ident' or tokens[i + 2].value != '=' or tokens[i + 3].value != '[':
+            return None
+        end = matches[i + 3]
+        if end < 0:
+            return None
+        elements = tokens[i + 4:end]
+        if len(elements) < 3 or len(elements) % 2 != 1:
+            return None
+        if any(t.kind != 'string' for t in elements[::2]) or any(t.value != ',' for t in elements[1::2]):
+            return None
+        return [self._string_value(t) for t in elements[::2]]
+
+    def _find_decoders(self, tokens: List[_Token], matches: List[int], array: Dict) -> Dict[str, Dict]:
+        """找出引用字符串数组的解码函数，识别下标偏移与编码方式"""
+        decoders = {}
+        name = array["name"]
+        array_start, array_end = array["span"]
+        for i in range(len(tokens) - 3):
+            if array_start <= i <= array_end:
+                continue
+            if tokens[i].value == 'function' and tokens[i + 1].kind == 'ident' and tokens[i + 2].value == '(':
+                decoder, params_open, start = tokens[i + 1].value, i + 2, i
+            elif tokens[i].value in _DECLARE_KEYWORDS and tokens[i + 1].kind == 'ident' \
+                    and tokens[i + 2].value == '=' and tokens[i + 3].value == 'function' \
+                    and i + 4 < len(tokens) and tokens[i + 4].value == '(':
+                decoder, params_open, start = tokens[i + 1].value, i + 4, i
+            else:
+                continue
+            params_close = matches[params_open]
+            if params_close < 0 or params_close == params_open + 1 or tokens[params_close + 1].value != '{':
+                continue
+            body_end = matches[params_close + 1]
+            if body_end < 0:
+                continue
+            body = tokens[params_close + 2:body_end]
+            if not any(t.kind == 'ident' and t.value == name for t in body):
+                continue
+            mode = self._detect_encoding(body)
+            offset = self._match_decoder_shape(body, name, mode)
+            if offset is None:
+                continue
+            end = body_end
+            if tokens[start].value in _DECLARE_KEYWORDS and end + 1 < len(tokens) and tokens[end + 1].value == ';':
+                end += 1
+            decoders[decoder] = {"offset": offset, "mode": mode, "span": (start, end)}
+        return decoders
+
+    def _match_decoder_shape(self, body: List[_Token], name: str, mode: str) -> Union[int, None]:
+        """校验 obfuscator.io 解码函数形态：下标减去偏移后取数组元素，直接返回或经base64/rc4解码
+
+        形态匹配时返回偏移量，否则返回 None
+        """
+        values = [t.value for t in body]
+        # 新版解码函数先通过 var arr = NAME() 取得数组
+        holders = {name} | {
+            values[k] for k in range(len(body) - 3)
+            if body[k].kind == 'ident' and values[k + 1] == '=' and values[k + 2] == name and values[k + 3] == '('
+        }
+        for k in range(len(body) - 2):
+            if body[k].kind != 'ident':
+                continue
+            if k + 4 < len(body) and values[k + 1] == '=' and values[k + 2] == values[k] \
+                    and values[k + 3] == '-' and self._is_decimal(body[k + 4]):
+                offset, after = int(float(values[k + 4])), k + 5
+            elif values[k + 1] == '-=' and self._is_decimal(body[k + 2]):
+                offset, after = int(float(values[k + 2])), k + 3
+            else:
+                continue
+            index = values[k]
+            for m in range(after, len(body) - 3):
+                if values[m] not in holders or values[m + 1:m + 4] != ['[', index, ']']:
+                    continue
+                if mode != 'plain' or values[m - 1] == 'return':
+                    return offset
+                # var v = arr[idx]; ... return v;
+                if values[m - 1] == '=' and body[m - 2].kind == 'ident':
+                    result = values[m - 2]
+                    for r in range(m + 4, len(body) - 1):
+                        if values[r] == 'return' and values[r + 1] == result \
+                                and (r + 2 == len(body) or values[r + 2] in (';', '}')):
+                            return offset
+                return None
+            return None
+        return None
+
+    @staticmethod
+    def _detect_encoding(body: List[_Token]) -> str:
+        has_alphabet = any(t.kind == 'string' and _OBF_ALPHABET in t.value for t in body)
+        if not has_alphabet:
+            return 'plain'
+        if any(t.kind == 'number' and t.value == '256' for t in body):
+            return 'rc4'
+        return 'base64'
+
+    @staticmethod
+    def _find_aliases(tokens: List[_Token], decoders: Dict) -> Dict[str, Dict]:
+        """收集 const a = decoder 形式的别名、指向的解码函数及声明位置"""
+        aliases = {}
+        targets = {name: name for name in decoders}
+        changed = True
+        while changed:
+            changed = False
+            for i in range(1, len(tokens) - 3):
+                tok = tokens[i]
+                if tok.kind != 'ident' or tok.value in targets or tokens[i + 1].value != '=' \
+                        or tokens[i + 2].value not in targets or tokens[i + 3].value not in (',', ';'):
+                    continue
+                before = tokens[i - 1].value
+                if before in _DECLARE_KEYWORDS:
+                    span = (i - 1, i + 3) if tokens[i + 3].value == ';' else (i, i + 3)
+                elif before == ',':
+                    span = (i - 1, i + 2)
+                else:
+                    continue
+                targets[tok.value] = targets[tokens[i + 2].value]
+                aliases[tok.value] = {"target": targets[tok.value], "span": span}
+                changed = True
+        return aliases
+
+    def _find_rotation(self, tokens, matches, array, decoders, aliases, deadline):
+        """定位数组轮转自执行函数并求出轮转次数，返回 (轮转后数组, 自执行函数范围)"""
+        values = array["values"]
+        name = array["name"]
+        for k in range(3, len(tokens) - 4):
+            if not (tokens[k].value == name and tokens[k - 1].value == '(' and tokens[k + 1].value == ','):
+                continue
+            # 校验和目标值可能为负数
+            sign_width = 1 if tokens[k + 2].value == '-' else 0
+            number, args_close = tokens[k + 2 + sign_width], k + 3 + sign_width
+            if not self._is_decimal(number) or args_close >= len(tokens) or tokens[args_close].value != ')':
+                continue
+            target = -float(number.value) if sign_width else float(number.value)
+            if tokens[k - 2].value == '}':
+                # (function(a, b){...}(NAME, N))
+                body_close, outer_close = k - 2, args_close + 1
+            elif tokens[k - 2].value == ')' and tokens[k - 3].value == '}':
+                # (function(a, b){...})(NAME, N)
+                body_close, outer_close = k - 3, args_close
+            else:
+                continue
+            body_open = matches[body_close]
+            if body_open < 2 or tokens[body_open - 1].value != ')':
+                continue
+            func_index = matches[body_open - 1] - 1
+            if func_index < 1 or tokens[func_index].value != 'function' or tokens[func_index - 1].value != '(':
+                continue
+            outer_open = func_index - 1
+            wrapper_close = outer_close if body_close == k - 2 else k - 2
+            if outer_close >= len(tokens) or matches[outer_open] != wrapper_close:
+                continue
+            end = outer_close + 1 if outer_close + 1 < len(tokens) and tokens[outer_close + 1].value == ';' \
+                else outer_close
+            body = tokens[body_open + 1:body_close]
+            # 成员访问可能仍是 arr['push'] 形式
+            body_words = {self._string_value(t) if t.kind == 'string' else t.value for t in body}
+            if 'parseInt' in body_words:
+                shift = self._solve_checksum(body, values, decoders, aliases, target, deadline)
+                if shift is None:
+                    return None
+            elif 'push' in body_words and 'shift' in body_words:
+                shift = int(target) % len(values)
+            else:
+                continue
+            return values[shift:] + values[:shift], (outer_open, end)
+        return values, None
+
+    def _solve_checksum(self, body, values, decoders, aliases, target, deadline) -> Union[int, None]:
+        """新版轮转以 parseInt 校验和为终止条件，逐次轮转直到表达式等于目标值"""
+        start = next(i for i, t in enumerate(body) if t.value == 'parseInt')
+        eq = start
+        while eq > 0 and body[eq].value != '=':
+            eq -= 1
+        semi = start
+        while semi < len(body) and body[semi].value != ';':
+            semi += 1
+        expr = body[eq + 1:semi]
+        for shift in range(len(values)):
+            self._check_deadline(deadline)
+            rotated = values[shift:] + values[:shift]
+            source = self._checksum_source(expr, rotated, decoders, aliases)
+            if source is None:
+                return None
+            try:
+                if _eval_arith(ast.parse(source, mode='eval')) == target:
+                    return shift
+            except (SyntaxError, ValueError, RecursionError):
+                return None
+        self.logger.debug("未找到满足校验和的轮转次数")
+        return None
+
+    def _checksum_source(self, expr, values, decoders, aliases) -> Union[str, None]:
+        parts = []
+        i = 0
+        while i < len(expr):
+            tok = expr[i]
+            if tok.value == 'parseInt' and i + 1 < len(expr) and expr[i + 1].value == '(':
+                call = self._parse_decoder_call(expr, i + 2, decoders, aliases)
+                if call is None or call[1] >= len(expr) or expr[call[1]].value != ')':
+                    return None
+                decoded = self._decode(call[0], decoders, aliases, values)
+                if decoded is None:
+                    return None
+                parts.append(repr(_js_parse_int(decoded)))
+                i = call[1] + 1
+            elif self._is_decimal(tok) or tok.value in _ARITH_OPS or tok.value in ('(', ')'):
+                parts.append(tok.value)
+                i += 1
+            else:
+                return None
+        return ' '.join(parts)
+
+    def _parse_decoder_call(self, tokens, i, decoders, aliases):
+        """解析 decoder(idx[, key])，返回 ((解码器, 下标, key), 调用结束位置)"""
+        if i + 3 >= len(tokens) or tokens[i].kind != 'ident' \
+                or (tokens[i].value not in decoders and tokens[i].value not in aliases) \
+                or tokens[i + 1].value != '(':
+            return None
+        arg = tokens[i + 2]
+        if self._is_decimal(arg):
+            index = float(arg.value)
+        elif arg.kind == 'string':
+            index = _js_to_number(self._string_value(arg))
+        else:
+            return None
+        key = None
+        close = i + 3
+        if tokens[close].value == ',':
+            if close + 2 >= len(tokens) or tokens[close + 1].kind != 'string':
+                return None
+            key = self._string_value(tokens[close + 1])
+            close += 2
+        if tokens[close].value != ')' or math.isnan(index):
+            return None
+        return (tokens[i].value, int(index), key), close + 1
+
+    @staticmethod
+    def _decode(call, decoders, aliases, values) -> Union[str, None]:
+        name, index, key = call
+        decoder = decoders.get(aliases[name]["target"] if name in aliases else name)
+        position = index - decoder["offset"]
+        if not 0 <= position < len(values):
+            return None
+        raw = values[position]
+        try:
+            if decoder["mode"] == 'base64':
+                return _decode_base64(raw)
+            if decoder["mode"] == 'rc4':
+                return _decode_rc4(raw, key) if key else None
+        except (ValueError, UnicodeError):
+            return None
+        return raw
+
+    def _inline_decoder_calls(self, tokens, matches, array, decoders, aliases, values, iife_span):
+        """将解码调用替换为字符串字面量；全部替换后删除数组、解码函数与轮转代码"""
+        removable = [array["span"]] + [d["span"] for d in decoders.values()] + [a["span"] for a in aliases.values()]
+        if iife_span:
+            removable.append(iife_span)
+        removed = [False] * len(tokens)
+        for start, end in removable:
+            self._mark(removed, start, end)
+        removed_ids = {id(tok) for tok, drop in zip(tokens, removed) if drop}
+
+        replacements = {}
+        names = set(decoders) | set(aliases) | {array["name"]}
+        remaining = 0
+        i = 0
+        while i < len(tokens):
+            tok = tokens[i]
+            if removed[i] or tok.kind != 'ident' or tok.value not in names:
+                i += 1
+                continue
+            prev = tokens[i - 1].value if i else ''
+            call = None if prev in ('.', 'function') else self._parse_decoder_call(tokens, i, decoders, aliases)
+            decoded = self._decode(call[0], decoders, aliases, values) if call else None
+            if decoded is None:
+                if prev != '.':
+                    remaining += 1
+                i += 1
+                continue
+            replacements[i] = (call[1], _Token('string', _js_quote(decoded), tok.prefix))
+            i = call[1]
+        if not replacements:
+            return tokens, 0
+
+        out = []
+        i = 0
+        while i < len(tokens):
+            if i in replacements:
+                end, new_tok = replacements[i]
+                out.append(new_tok)
+                i = end
+                continue
+            out.append(tokens[i])
+            i += 1
+        if not remaining:
+            out = self._drop_marked(out, [id(tok) in removed_ids for tok in out])
+        else:
+            self.logger.debug("解码函数仍有 %d 处动态引用，保留原定义", remaining)
+        return out, len(replacements)
+
+    # ----------------- 死代码删除 -----------------
+
+    def _drop_dead_code(self, tokens: List[_Token], deadline: float) -> Tuple[List[_Token], int]:
+        """删除 if(true)/if(false) 中不可达的分支"""
+        matches = self._match_brackets(tokens)
+        removed = [False] * len(tokens)
+        count = 0
+        for i in range(len(tokens) - 4):
+            if removed[i] or tokens[i].value != 'if' or tokens[i + 1].value != '(' \
+                    or tokens[i + 2].value not in ('true', 'false') or tokens[i + 3].value != ')' \
+                    or tokens[i + 4].value != '{':
+                continue
+            block_end = matches[i + 4]
+            if block_end < 0:
+                continue
+            has_else = block_end + 1 < len(tokens) and tokens[block_end + 1].value == 'else'
+            else_block = has_else and block_end + 2 < len(tokens) and tokens[block_end + 2].value == '{'
+            else_end = matches[block_end + 2] if else_block else -1
+            if tokens[i + 2].value == 'true':
+                if has_else and else_end < 0:
+                    continue
+                self._mark(removed, i, i + 3)
+                if has_else:
+                    self._mark(removed, block_end + 1, else_end)
+            elif has_else:
+                # else 分支保留为语句，删除 if(false){...} else
+                self._mark(removed, i, block_end + 1)
+            else:
+                prev = tokens[i - 1].value if i else ';'
+                if prev in (';', '{', '}'):
+                    self._mark(removed, i, block_end)
+                else:
+                    # 作为其它语句的子语句时保留空块
+                    self._mark(removed, i, i + 3)
+                    self._mark(removed, i + 5, block_end - 1)
+            count += 1
+        if not count:
+            return tokens, 0
+        return self._drop_marked(tokens, removed), count
+
+    @staticmethod
+    def _drop_marked(tokens: List[_Token], removed: List[bool]) -> List[_Token]:
+        """删除被标记的词法单元，并把换行等前缀转移到其后保留的单元上"""
+        out = []
+        pending = ''
+        for tok, drop in zip(tokens, removed):
+            if drop:
+                pending = pending or tok.prefix
+                continue
+            if pending and not tok.prefix:
+                tok.prefix = pending
+            pending = ''
+            out.append(tok)
+        return out
+
+    @staticmethod
+    def _mark(removed: List[bool], start: int, end: int) -> None:
+        for k in range(start, end + 1):
+            removed[k] = True
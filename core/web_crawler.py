@@ -1,10 +1,11 @@
 # core/web_crawler.py
 import re
 import os
+import hashlib
 import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
-from typing import List, Tuple, Union
+from typing import Dict, List, Set, Tuple, Union
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from time import sleep
 from config.ai_settings import AI_CONSTANTS
@@ -26,7 +27,7 @@ class DNSCacheAdapter(requests.adapters.HTTPAdapter):
         return super().get_connection(url, proxies)
 
 class JSExtractor:
-    def __init__(self, timeout=600, max_depth=2):
+    def __init__(self, timeout=600, max_depth=2, deobfuscator=None):
         self.session = requests.Session()
         # 优先挂载DNS缓存适配器
         self.session.mount('https://', DNSCacheAdapter())
@@ -34,6 +35,10 @@ class JSExtractor:
         self.timeout = timeout
         self.max_depth = max_depth
         self.visited_urls = set()
+        # 可选的反混淆器，需在脚本拼接压缩空白之前逐个处理
+        self.deobfuscator = deobfuscator
+        # 最近一次 extract_from_url 的反混淆汇总统计
+        self.deobfuscation_stats = {}
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept-Language': 'en-US,en;q=0.9',
@@ -71,12 +76,130 @@ class JSExtractor:
             #print("html",html)
             inline_scripts = self._extract_inline_js(html)
             external_scripts = self._extract_external_js(html, url)
+            scripts = inline_scripts + external_scripts
+            if self.deobfuscator:
+                results = [self.deobfuscator.deobfuscate(code) for code in scripts]
+                scripts = [code for code, _ in results]
+                self.deobfuscation_stats = self.deobfuscator.merge_stats([stats for _, stats in results])
             
-            all_js = '\n'.join(inline_scripts + external_scripts)
+            all_js = '\n'.join(scripts)
             return re.sub(r'\s+', ' ', all_js).strip(), list(self.visited_urls)
         except Exception as e:
             raise RuntimeError(f"网页分析失败: {str(e)}")
 
+    def extract_changes(self, url: str, snapshot: Dict) -> Tuple[Dict, Dict[str, str]]:
+        """监控模式入口：基于上次快照发起条件请求，仅返回新增或变化的脚本
+
+        返回 (新快照, {脚本标识: 脚本内容})，内联脚本以 inline:<页面内序号> 标识
+        """
+        self.visited_urls.add(url)
+        old_page = snapshot.get("page", {})
+        old_scripts = snapshot.get("scripts", {})
+        stats = {"not_modified": 0, "downloaded": 0}
+        try:
+            resp = self._fetch_html_response(url, self._conditional_headers(old_page))
+            if resp.status_code == 304:
+                # 页面未变化，沿用上次的完整脚本清单（含上次获取失败的脚本）
+                stats["not_modified"] += 1
+                page = old_page
+                changed = {}
+                script_urls = set(old_page.get("script_urls", [])) | {
+                    sid for sid in old_scripts if not sid.startswith("inline:")
+                }
+                scripts = {sid: entry for sid, entry in old_scripts.items() if sid.startswith("inline:")}
+            else:
+                stats["downloaded"] += 1
+                html = re.sub(r'<!--.*?-->', '', resp.text, flags=re.DOTALL)
+                page = {**self._response_validators(resp), "hash": self._content_hash(html)}
+                script_urls = self._collect_script_urls(html, resp.url or url)
+                page["script_urls"] = sorted(script_urls)
+                # 内联脚本按页面内位置标识、哈希单独比较，内容变化记为变化而非删除+新增
+                scripts, changed = {}, {}
+                for index, code in enumerate(self._extract_inline_js(html)):
+                    sid = f"inline:{index}"
+                    old_entry = old_scripts.get(sid, {})
+                    entry = {"hash": self._content_hash(code)}
+                    if entry["hash"] == old_entry.get("hash"):
+                        entry["findings"] = old_entry.get("findings", [])
+                    else:
+                        changed[sid] = code
+                    scripts[sid] = entry
+
+            # 并发发起条件请求
+            with ThreadPoolExecutor(max_workers=max(1, min(10, len(script_urls)))) as executor:
+                future_to_url = {
+                    executor.submit(
+                        self._fetch_js_response,
+                        script_url,
+                        self._conditional_headers(old_scripts.get(script_url, {}))
+                    ): script_url
+                    for script_url in script_urls
+                }
+                for future in as_completed(future_to_url):
+                    script_url = future_to_url[future]
+                    old_entry = old_scripts.get(script_url, {})
+                    try:
+                        js_resp = future.result()
+                    except Exception as e:
+                        self.logger.warning("JS获取失败 URL: %s 错误: %s", script_url, str(e))
+                        js_resp = None
+                    if js_resp is None:
+                        # 获取失败时保留旧记录，避免误报为删除
+                        if old_entry:
+                            scripts[script_url] = old_entry
+                        continue
+                    self.visited_urls.add(script_url)
+                    if js_resp.status_code == 304:
+                        stats["not_modified"] += 1
+                        scripts[script_url] = old_entry
+                        continue
+                    stats["downloaded"] += 1
+                    content = js_resp.text.strip()
+                    if not content:
+                        # 空响应按获取失败处理，保留旧记录，避免误报特征删除
+                        self.logger.warning("JS响应为空 URL: %s", script_url)
+                        if old_entry:
+                            scripts[script_url] = old_entry
+                        continue
+                    entry = {**self._response_validators(js_resp), "hash": self._content_hash(content)}
+                    if entry["hash"] == old_entry.get("hash"):
+                        # 服务端不支持条件请求但内容一致
+                        entry["findings"] = old_entry.get("findings", [])
+                    else:
+                        changed[script_url] = content
+                    scripts[script_url] = entry
+        except Exception as e:
+            raise RuntimeError(f"网页监控失败: {str(e)}")
+
+        self.logger.info(
+            "监控抓取完成 URL: %s 未变化: %d 已下载: %d 变化脚本: %d",
+            url, stats["not_modified"], stats["downloaded"], len(changed)
+        )
+        new_snapshot = {"url": url, "page": page, "scripts": scripts, "stats": stats}
+        return new_snapshot, changed
+
+    @staticmethod
+    def _conditional_headers(entry: Dict) -> Dict:
+        """根据快照记录构造条件请求头"""
+        headers = {}
+        if entry.get("etag"):
+            headers['If-None-Match'] = entry["etag"]
+        if entry.get("last_modified"):
+            headers['If-Modified-Since'] = entry["last_modified"]
+        return headers
+
+    @staticmethod
+    def _response_validators(resp: requests.Response) -> Dict:
+        """提取响应中的缓存校验字段"""
+        return {
+            "etag": resp.headers.get('ETag'),
+            "last_modified": resp.headers.get('Last-Modified')
+        }
+
+    @staticmethod
+    def _content_hash(content: str) -> str:
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
     def _extract_inline_js(self, html: str) -> List[str]:
         """内联JS提取优化版"""
         soup = BeautifulSoup(html, 'html.parser')
@@ -90,24 +213,7 @@ class JSExtractor:
 
     def _extract_external_js(self, html: str, base_url: str) -> List[str]:
         """增强版外部JS提取"""
-        soup = BeautifulSoup(html, 'html.parser')
-        valid_urls = set()
-        
-        # 标准script标签
-        for script in soup.find_all('script', src=True):
-            script_url = urljoin(base_url, script['src'])
-            if self._is_valid_script(script_url):
-                valid_urls.add(script_url)
-        
-        # 动态加载模式检测
-        dynamic_pattern = re.compile(
-            r'document\.write\([\'"]<script\b[^>]*src=[\'"]([^\'"]+)[\'"]',
-            re.IGNORECASE
-        )
-        for match in dynamic_pattern.findall(html):
-            script_url = urljoin(base_url, match)
-            if self._is_valid_script(script_url):
-                valid_urls.add(script_url)
+        valid_urls = self._collect_script_urls(html, base_url)
         
         # 并发获取内容
         scripts = []
@@ -130,6 +236,28 @@ class JSExtractor:
         
         return scripts
 
+    def _collect_script_urls(self, html: str, base_url: str) -> Set[str]:
+        """收集页面引用的外部JS地址"""
+        soup = BeautifulSoup(html, 'html.parser')
+        valid_urls = set()
+        
+        # 标准script标签
+        for script in soup.find_all('script', src=True):
+            script_url = urljoin(base_url, script['src'])
+            if self._is_valid_script(script_url):
+                valid_urls.add(script_url)
+        
+        # 动态加载模式检测
+        dynamic_pattern = re.compile(
+            r'document\.write\([\'"]<script\b[^>]*src=[\'"]([^\'"]+)[\'"]',
+            re.IGNORECASE
+        )
+        for match in dynamic_pattern.findall(html):
+            script_url = urljoin(base_url, match)
+            if self._is_valid_script(script_url):
+                valid_urls.add(script_url)
+        return valid_urls
+
     def _is_valid_script(self, url: str) -> bool:
         """资源有效性验证"""
         # 黑名单过滤
@@ -144,22 +272,32 @@ class JSExtractor:
 
     def _fetch_html(self, url: str) -> str:
         """智能重定向处理版本"""
+        return self._fetch_html_response(url).text
+
+    def _fetch_html_response(self, url: str, extra_headers: Dict = None) -> requests.Response:
+        """抓取页面并返回最终响应，条件请求命中时直接返回304响应"""
         self.logger.info("开始抓取页面 URL: %s", url)
         max_redirects = 5
         current_url = url
         visited = []
+        headers = {**self.headers, **(extra_headers or {})}
         
         for _ in range(max_redirects):
             try:
                 # 禁用自动重定向以便手动处理
                 resp = self.session.get(
                     current_url,
-                    headers=self.headers,
+                    headers=headers,
                     timeout=self.timeout,
                     allow_redirects=False
                 )
                 visited.append(current_url)
                 
+                # 内容未变化
+                if resp.status_code == 304:
+                    self.logger.info("页面未变化 URL: %s", current_url)
+                    return resp
+                
                 # 处理HTTP重定向
                 if 300 <= resp.status_code < 400:
                     new_url = urljoin(current_url, resp.headers.get('Location', ''))
@@ -178,7 +316,7 @@ class JSExtractor:
                         current_url = redirect_url
                         continue
                     self.logger.debug("HTML获取成功 长度: %d 字符", len(html))
-                    return html
+                    return resp
                     
                 resp.raise_for_status()
                 
@@ -212,16 +350,27 @@ class JSExtractor:
 
     def _fetch_js_content(self, url: str) -> Union[str, None]:
         """带重试机制的JS获取"""
+        resp = self._fetch_js_response(url)
+        return resp.text.strip() if resp is not None else None
+
+    def _fetch_js_response(self, url: str, extra_headers: Dict = None) -> Union[requests.Response, None]:
+        """带重试机制的JS请求，支持条件请求头"""
+        headers = {**self.headers, **(extra_headers or {})}
         for attempt in range(3):
             self.logger.debug("获取JS资源 URL: %s 第%d次尝试", url, attempt+1)
             try:
                 resp = self.session.get(
                     url,
-                    headers=self.headers,
+                    headers=headers,
                     timeout=self.timeout,
                     allow_redirects=True
                 )
                 
+                # 304响应不携带内容，无需校验类型
+                if resp.status_code == 304:
+                    self.logger.info("JS未变化 URL: %s", url)
+                    return resp
+                
                 # 内容类型验证
                 content_type = resp.headers.get('Content-Type', '')
                 if 'javascript' not in content_type and 'text/plain' not in content_type:
@@ -229,10 +378,10 @@ class JSExtractor:
                 
                 resp.raise_for_status()
                 self.logger.info("JS获取成功 URL: %s", url)
-                return resp.text.strip()
+                return resp
             except (requests.exceptions.RequestException, TimeoutError) as e:
                 self.logger.warning("JS获取失败 URL: %s 错误: %s", url, str(e))
                 if attempt == 2:
                     raise
                 sleep(0.5 * (2 ** attempt))
-        return None
\ No newline at end of file
+        return None
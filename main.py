@@ -2,6 +2,7 @@ import argparse
 import asyncio
 from core.ai_analyzer import AIAnalyzer
 from core.web_crawler import JSExtractor
+from core.change_monitor import ChangeMonitor
 from config.log_config import configure_logger
 logger = configure_logger('主程序')
 
@@ -33,19 +34,38 @@ def main():
     parser = argparse.ArgumentParser(description='JS加密算法识别工具')
     parser.add_argument('-u', '--url', help='待分析的网页URL')
     parser.add_argument('-f', '--file', help='本地JS文件路径')
+    parser.add_argument('-m', '--monitor', action='store_true', help='监控模式：仅分析相对上次扫描新增或变化的脚本')
     args = parser.parse_args()
 
     analyzer = AIAnalyzer()
-    extractor = JSExtractor()
-    logger.info("命令行参数 URL:%s FILE:%s", args.url, args.file)
-    if args.url:
+    extractor = JSExtractor(deobfuscator=analyzer.deobfuscator)
+    logger.info("命令行参数 URL:%s FILE:%s MONITOR:%s", args.url, args.file, args.monitor)
+    if args.url and args.monitor:
+        print(f"\n开始监控URL: {args.url}")
+        try:
+            report = ChangeMonitor(extractor, analyzer).run(args.url)
+            print(f"未变化: {report['requests']['not_modified']} 已下载: {report['requests']['downloaded']}")
+            print("\n[变化报告]")
+            print(report)
+            if report["ai_analysis"] and report["ai_analysis"]["errors"]:
+                print("\n警告信息:", report["ai_analysis"]["errors"])
+
+        except KeyboardInterrupt:
+            logger.warning("用户中断执行")
+
+        except Exception as e:
+            print(f"监控失败: {str(e)}")
+
+    elif args.url:
         print(f"\n开始分析URL: {args.url}")
         logger.debug("开始分析URL:%s", args.url)
         try:
             js_code, crawled_urls = extractor.extract_from_url(args.url)
             print(f"抓取到{len(crawled_urls)}个JS资源")
             
-            result = analyzer.analyze_code(js_code)
+            # 脚本已在抓取时逐个反混淆，拼接后的单行代码不再重复处理
+            result = analyzer.analyze_code(js_code, deobfuscate=False)
+            result["deobfuscation"] = extractor.deobfuscation_stats
             print("\n[最终分析报告]")
             print(result)
             """
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# 测试直接导入 core/config 包
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,19 @@
+// 普通代码回归用例
+var months = ['Jan', 'Feb', 'Mar'];
+function month(i) { return months[i].toUpperCase(); }
+var re = /a\/b[/]c/g, x = 1;
+var s = "line\nnextq's中文";
+var obj = {'a-b': 1, c: 2, 'default': 3};
+for (var k of ['x', 'y']) console.log(k);
+var t = `tpl ${1 + 2}`;
+console.log(month(1), re.test('a/b/c'), x, s, obj['a-b'], obj.c, obj.default);
+console.log(2, 2 * 3 ** 2, 'a' + 1 + 2, 3 + 'a', 1, -1, 0.30000000000000004, (5).toString(2));
+console.log(true ? 'y' : 'n', true, false , true, typeof (5), void (0), 5, 3); { let z = 1; console.log('z', z); }
+if (x) { console.log('else-branch'); }
+var f = (a) => (a + 1);
+console.log(f(1), [1, 2, 3].length, 'abc'['length'], 'AB', 16 + 010 === 18 ? 'oct' : 'dec');
+label: for (var q = 0; q < 2; q++) { continue label; }
+var a = 5
+var b = a
+++b
+console.log(a, b, 1001, 0.75, 2 / 0, 255 .toString(16));
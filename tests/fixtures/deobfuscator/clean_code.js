@@ -0,0 +1,21 @@
+// 普通代码回归用例
+var months = ['Jan', 'Feb', 'Mar'];
+function month(i) { return months[i].toUpperCase(); }
+var re = /a\/b[/]c/g, x = 10 / 2 / 5;
+var s = "line\nnext" + 'q\'s' + "中文";
+var obj = {'a-b': 1, c: 2, 'default': 3};
+for (var k of ['x', 'y']) console.log(k);
+var t = `tpl ${1 + 2}`;
+console.log(month(1), re.test('a/b/c'), x, s, obj['a-b'], obj['c'], obj['default']);
+console.log(1 - -1, 2 * 3 ** 2, 'a' + 1 + 2, 1 + 2 + 'a', 7 % -3, -7 % 3, 0.1 + 0.2, (5).toString(2));
+console.log('a' === 'a' ? 'y' : 'n', 1 == 1.0, ![] , !![], typeof (5), void (0), -(-5), +(3));
+if (false) { console.log('never'); }
+if (true) { let z = 1; console.log('z', z); } else { console.log('no'); }
+if (x) if (false) { console.log('n'); } else { console.log('else-branch'); }
+var f = (a) => (a + 1);
+console.log(f(1), [1, 2, 3]['length'], 'abc'['length'], "\x41\x42", 0x10 + 010 === 18 ? 'oct' : 'dec');
+label: for (var q = 0; q < 2; q++) { continue label; }
+var a = 5
+var b = a
+++b
+console.log(a, b, 1e3 + 1, .5 + .25, 2 / 0, 0xff.toString(16));
@@ -0,0 +1,5 @@
+var cfg={};cfg.mode='AES-CBC';
+var fakeCrypto={AES:{encrypt:function(a,b,c){return 'E('+a+','+b+','+c.mode+')';}}};
+var out=fakeCrypto.AES.encrypt('data','k'+28,{'mode':'CBC'});
+{console.log(out, cfg);}
+console.log(37, 'RSA', 'sm4.encrypt', true);
@@ -0,0 +1,9 @@
+function _0x1c2d(){var _0x5a=['ywjJ','uLnb','z2vUzxjHDgu','C200','mZe0mxP6','zw5J','quvt','zw5JCNLWDa','vxrMoa','CgfYC2u','mtiZndu2n2TlyujJ','Bg9N','Bw9Kzq','q0jd','odKYmdfyEvPXuq','CgfK','ugTJCZC','ntu2n2fHvW','Dg9tDhjPBMC','C2HPzNq','ChvZAa','otK4odfTBKi'];_0x1c2d=function(){return _0x5a;};return _0x1c2d();}
+(function(_0x3b,_0x4e){var _0x2f=_0x4a1b,_0x1a=_0x3b();while(!![]){try{var _0x6c=parseInt(_0x2f(0x1e8))/0x1+-parseInt(_0x2f(0x1ec))/0x2*(parseInt(_0x2f(0x1ef))/0x3)+parseInt(_0x2f(0x1f3))/0x4;if(_0x6c===_0x4e)break;else _0x1a['push'](_0x1a['shift']());}catch(_0x7d){_0x1a['push'](_0x1a['shift']());}}}(_0x1c2d,-81504123.91666667));
+function _0x4a1b(_0x1,_0x2){var _0x3=_0x1c2d();return _0x4a1b=function(_0x4,_0x5){_0x4=_0x4-0x1e3;var _0x6=_0x3[_0x4];var _0x7=function(_0x8){var _0x9='abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789+/=';var _0xa='',_0xb='';for(var _0xc=0,_0xd,_0xe,_0xf=0;_0xe=_0x8['charAt'](_0xf++);~_0xe&&(_0xd=_0xc%0x4?_0xd*0x40+_0xe:_0xe,_0xc++%0x4)?_0xa+=String['fromCharCode'](0xff&_0xd>>(-0x2*_0xc&0x6)):0x0){_0xe=_0x9['indexOf'](_0xe);}for(var _0x10=0x0,_0x11=_0xa['length'];_0x10<_0x11;_0x10++){_0xb+='%'+('00'+_0xa['charCodeAt'](_0x10)['toString'](0x10))['slice'](-0x2);}return decodeURIComponent(_0xb);};return _0x7(_0x6);},_0x4a1b(_0x1,_0x2);}
+var _0xk=_0x4a1b;
+var cfg={};cfg[_0xk(0x1ea)]=_0xk(0x1e4)+'-'+_0xk(0x1eb);
+var fakeCrypto={AES:{encrypt:function(a,b,c){return 'E('+a+','+b+','+c[_0xk(0x1ea)]+')';}}};
+var out=fakeCrypto[_0xk(0x1e4)][_0xk(0x1e5)]('data','k'+(0x10*0x2-0x4),{'mode':_0xk(0x1eb)});
+if(_0xk(0x1f4)==='abc'){console[_0xk(0x1e9)](out, cfg);}else{console[_0xk(0x1e9)]('dead');}
+console[_0xk(0x1e9)](0x1f+0x3*0x2, "\x52\x53\x41", '\u0073m4' + "." + 'encrypt', !![]);
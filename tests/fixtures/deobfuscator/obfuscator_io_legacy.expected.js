@@ -0,0 +1 @@
+var RSA={generate:function(n){return 'key'+n;}};console.log(RSA.generate(2048), 'AESencrypt');
@@ -0,0 +1,4 @@
+var _0xabc=['\x52\x53\x41','\x67\x65\x6e\x65\x72\x61\x74\x65','\x6c\x6f\x67','\x41\x45\x53','\x65\x6e\x63\x72\x79\x70\x74'];
+(function(_0x1,_0x2){var _0x3=function(_0x4){while(--_0x4){_0x1['push'](_0x1['shift']());}};_0x3(++_0x2);}(_0xabc,0x7));
+var _0xdef=function(_0x1,_0x2){_0x1=_0x1-0x0;var _0x3=_0xabc[_0x1];return _0x3;};
+var RSA={generate:function(n){return 'key'+n;}};console[_0xdef('0x0')](RSA[_0xdef('0x4')](0x400*0x2), _0xdef('0x1')+_0xdef('0x2'));
@@ -0,0 +1,9 @@
+function _0x1c2d(){var _0x5a=['w8xA','+yXl','YCDg6/Yi/0W','sCQn','Mo4+TT2Z','Y8Xl','E+lQ','ZRfP9D652W','+9zoTG','sSBlqbe','MU05S5l/MfRglVy/','WS1p','v8JDvG','6j1j','LPSAVR+X8NpM5a','sSBD','+7rP9ja','M5CEUE+i3a','tSJQrWyuXPO','2lDJ4Dm','3TDB5G','a56bc0uqXR8'];_0x1c2d=function(){return _0x5a;};return _0x1c2d();}
+(function(_0x3b,_0x4e){var _0x2f=_0x4a1b,_0x1a=_0x3b();while(!![]){try{var _0x6c=parseInt(_0x2f(0x1e8,'k1'))/0x1+-parseInt(_0x2f(0x1ec,'k2'))/0x2*(parseInt(_0x2f(0x1ef,'k2'))/0x3)+parseInt(_0x2f(0x1f3,'k0'))/0x4;if(_0x6c===_0x4e)break;else _0x1a['push'](_0x1a['shift']());}catch(_0x7d){_0x1a['push'](_0x1a['shift']());}}}(_0x1c2d,-81504123.91666667));
+function _0x4a1b(_0x1,_0x2){var _0x3=_0x1c2d();return _0x4a1b=function(_0x4,_0x5){_0x4=_0x4-0x1e3;var _0x6=_0x3[_0x4];var _0x7=function(_0x8){var _0x9='abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789+/=';var _0xa='',_0xb='';for(var _0xc=0,_0xd,_0xe,_0xf=0;_0xe=_0x8['charAt'](_0xf++);~_0xe&&(_0xd=_0xc%0x4?_0xd*0x40+_0xe:_0xe,_0xc++%0x4)?_0xa+=String['fromCharCode'](0xff&_0xd>>(-0x2*_0xc&0x6)):0x0){_0xe=_0x9['indexOf'](_0xe);}return _0xa;};var _0x12=function(_0x13,_0x14){var _0x15=[],_0x16=0x0,_0x17,_0x18='';_0x13=_0x7(_0x13);var _0x19;for(_0x19=0x0;_0x19<0x100;_0x19++){_0x15[_0x19]=_0x19;}for(_0x19=0x0;_0x19<0x100;_0x19++){_0x16=(_0x16+_0x15[_0x19]+_0x14['charCodeAt'](_0x19%_0x14['length']))%0x100;_0x17=_0x15[_0x19];_0x15[_0x19]=_0x15[_0x16];_0x15[_0x16]=_0x17;}_0x19=0x0;_0x16=0x0;for(var _0x1a=0x0;_0x1a<_0x13['length'];_0x1a++){_0x19=(_0x19+0x1)%0x100;_0x16=(_0x16+_0x15[_0x19])%0x100;_0x17=_0x15[_0x19];_0x15[_0x19]=_0x15[_0x16];_0x15[_0x16]=_0x17;_0x18+=String['fromCharCode'](_0x13['charCodeAt'](_0x1a)^_0x15[(_0x15[_0x19]+_0x15[_0x16])%0x100]);}return _0x18;};return _0x12(_0x6,_0x5);},_0x4a1b(_0x1,_0x2);}
+var _0xk=_0x4a1b;
+var cfg={};cfg[_0xk(0x1ea,'k0')]=_0xk(0x1e4,'k0')+'-'+_0xk(0x1eb,'k1');
+var fakeCrypto={AES:{encrypt:function(a,b,c){return 'E('+a+','+b+','+c[_0xk(0x1ea,'k0')]+')';}}};
+var out=fakeCrypto[_0xk(0x1e4,'k0')][_0xk(0x1e5,'k1')]('data','k'+(0x10*0x2-0x4),{'mode':_0xk(0x1eb,'k1')});
+if(_0xk(0x1f4,'k0')==='abc'){console[_0xk(0x1e9,'k2')](out, cfg);}else{console[_0xk(0x1e9,'k2')]('dead');}
+console[_0xk(0x1e9,'k2')](0x1f+0x3*0x2, "\x52\x53\x41", '\u0073m4' + "." + 'encrypt', !![]);
@@ -0,0 +1,117 @@
+import pytest
+
+from core.change_monitor import ChangeMonitor, SnapshotStore
+from core.deobfuscator import Deobfuscator
+
+URL = "http://example.test/index.html"
+
+
+class FakeExtractor:
+    def __init__(self, snapshot, changed):
+        self.snapshot = snapshot
+        self.changed = changed
+        self.received = None
+
+    def extract_changes(self, url, snapshot):
+        self.received = snapshot
+        return self.snapshot, dict(self.changed)
+
+
+class FakeAnalyzer:
+    """本地特征按代码中出现的算法名匹配，AI 分析仅记录调用"""
+
+    def __init__(self):
+        self.deobfuscator = Deobfuscator()
+        self.calls = []
+
+    def _match_local_features(self, code):
+        return [{"category": "symmetric", "algorithm": name} for name in ("AES", "DES") if name in code]
+
+    def analyze_code(self, code, deobfuscate=True):
+        self.calls.append((code, deobfuscate))
+        return {"algorithm_analysis": {"ai": {}, "local": []}, "errors": []}
+
+
+def new_snapshot(scripts):
+    return {"url": URL, "page": {}, "scripts": scripts, "stats": {"not_modified": 0, "downloaded": 1}}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(tmp_path)
+
+
+def test_store_round_trip(store):
+    assert store.load(URL) == {}
+    store.save(URL, {"scripts": {"a.js": {"hash": "1"}}})
+    assert store.load(URL) == {"scripts": {"a.js": {"hash": "1"}}}
+    assert store.load("http://other.test/") == {}
+
+
+def test_store_corrupt_snapshot_treated_as_first_scan(store):
+    store.save(URL, {})
+    store._path_for(URL).write_text("{broken", encoding="utf-8")
+    assert store.load(URL) == {}
+
+
+def test_first_scan_reports_new_scripts(store):
+    extractor = FakeExtractor(
+        new_snapshot({"a.js": {"hash": "1"}, "inline:0": {"hash": "2"}}),
+        {"a.js": "CryptoJS.AES.encrypt(x, k);", "inline:0": "init();"},
+    )
+    analyzer = FakeAnalyzer()
+    report = ChangeMonitor(extractor, analyzer, store).run(URL)
+    assert report["first_scan"] is True
+    assert report["new_scripts"] == ["a.js", "inline:0"]
+    assert report["added_algorithms"] == ["symmetric/AES"]
+    assert report["deobfuscation"]["scripts"] == 2
+    assert report["ai_analysis"]["deobfuscation"] == report["deobfuscation"]
+    assert analyzer.calls and analyzer.calls[0][1] is False
+    saved = store.load(URL)
+    assert saved["scripts"]["a.js"]["findings"] == ["symmetric/AES"]
+    assert "stats" not in saved and saved["updated_at"]
+
+
+def test_changes_and_algorithm_diff(store):
+    store.save(URL, {
+        "updated_at": "2024-01-01T00:00:00",
+        "scripts": {
+            "a.js": {"hash": "1", "findings": ["symmetric/AES"]},
+            "b.js": {"hash": "2", "findings": []},
+            "c.js": {"hash": "3", "findings": ["symmetric/DES"]},
+        },
+    })
+    extractor = FakeExtractor(
+        new_snapshot({"a.js": {"hash": "1", "findings": ["symmetric/AES"]}, "b.js": {"hash": "4"}, "d.js": {"hash": "5"}}),
+        {"b.js": "var s = 'DES';", "d.js": "var d = 1;"},
+    )
+    report = ChangeMonitor(extractor, FakeAnalyzer(), store).run(URL)
+    assert extractor.received["updated_at"] == "2024-01-01T00:00:00"
+    assert report["first_scan"] is False
+    assert report["last_scan"] == "2024-01-01T00:00:00"
+    assert report["changed_scripts"] == ["b.js"]
+    assert report["new_scripts"] == ["d.js"]
+    assert report["removed_scripts"] == ["c.js"]
+    # DES 从 c.js 移到 b.js，整体特征集合不变
+    assert report["added_algorithms"] == []
+    assert report["removed_algorithms"] == []
+
+
+def test_removed_algorithm_reported(store):
+    store.save(URL, {"scripts": {"a.js": {"hash": "1", "findings": ["symmetric/AES"]}}})
+    extractor = FakeExtractor(new_snapshot({"a.js": {"hash": "2"}}), {"a.js": "var plain = 1;"})
+    report = ChangeMonitor(extractor, FakeAnalyzer(), store).run(URL)
+    assert report["changed_scripts"] == ["a.js"]
+    assert report["removed_algorithms"] == ["symmetric/AES"]
+    assert store.load(URL)["scripts"]["a.js"]["findings"] == []
+
+
+def test_no_changes_skips_ai_call(store):
+    store.save(URL, {"scripts": {"a.js": {"hash": "1", "findings": ["symmetric/AES"]}}})
+    extractor = FakeExtractor(new_snapshot({"a.js": {"hash": "1", "findings": ["symmetric/AES"]}}), {})
+    analyzer = FakeAnalyzer()
+    report = ChangeMonitor(extractor, analyzer, store).run(URL)
+    assert analyzer.calls == []
+    assert report["ai_analysis"] is None
+    assert report["added_algorithms"] == report["removed_algorithms"] == []
+    assert report["deobfuscation"]["scripts"] == 0
@@ -0,0 +1,121 @@
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from core.deobfuscator import Deobfuscator
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "deobfuscator"
+FIXTURES = sorted(p for p in FIXTURE_DIR.glob("*.js") if not p.name.endswith(".expected.js"))
+NODE = shutil.which("node")
+
+
+@pytest.fixture(scope="module")
+def deobfuscator():
+    return Deobfuscator()
+
+
+def run_node(code: str) -> str:
+    proc = subprocess.run([NODE, "-e", code], capture_output=True, text=True, timeout=30)
+    assert proc.returncode == 0, proc.stderr
+    return proc.stdout
+
+
+@pytest.mark.parametrize("path", FIXTURES, ids=lambda p: p.stem)
+def test_fixture_matches_expected(deobfuscator, path):
+    code, stats = deobfuscator.deobfuscate(path.read_text(encoding="utf-8"))
+    expected = path.with_name(f"{path.stem}.expected.js").read_text(encoding="utf-8")
+    assert stats["status"] == "ok"
+    assert code == expected.rstrip("\n")
+
+
+@pytest.mark.skipif(NODE is None, reason="需要 node 校验运行结果")
+@pytest.mark.parametrize("path", FIXTURES, ids=lambda p: p.stem)
+def test_fixture_preserves_behaviour(deobfuscator, path):
+    source = path.read_text(encoding="utf-8")
+    code, _ = deobfuscator.deobfuscate(source)
+    assert run_node(code) == run_node(source)
+
+
+@pytest.mark.parametrize("name", ["obfuscator_io_base64", "obfuscator_io_rc4", "obfuscator_io_legacy"])
+def test_string_array_removed(deobfuscator, name):
+    code, stats = deobfuscator.deobfuscate((FIXTURE_DIR / f"{name}.js").read_text(encoding="utf-8"))
+    assert stats["strings_decoded"] > 0
+    assert "_0x" not in code
+
+
+# 不应被改写语义的普通代码
+CLEAN_CASES = [
+    # 普通 _0x 数组与非解码函数
+    "var _0x1a=['alpha','beta','gamma']; function _0x2b(_0x3c){ return _0x1a.indexOf(_0x3c) >= 0; }"
+    " console.log(_0x2b(1), _0x2b(0));",
+    # 无轮转函数、无包装函数的数组即便形似解码函数也不内联
+    "var _0x1a=['alpha','beta','gamma']; var _0x2b=function(_0x3c){_0x3c=_0x3c-0x0;var _0x4d=_0x1a[_0x3c];"
+    "return _0x4d;}; _0x1a[0]='changed'; console.log(_0x2b('0x0'));",
+    "console.log(![].length, !![].length, ![], !![]);",
+    "var y = +'1' + '2'; var z = 1 + '1' + '2'; console.log(y, typeof y, z);",
+    # 类与对象字面量中的计算属性名不是成员访问
+    "class A { get ['async']() { return 1; } static ['x']() { return 2; } set ['y'](v) {} }"
+    " var o = { get ['k']() { return 3; } }; console.log(new A().async, A.x(), o.k);",
+]
+
+
+@pytest.mark.parametrize("source", CLEAN_CASES)
+def test_clean_code_not_rewritten_incorrectly(deobfuscator, source):
+    code, _ = deobfuscator.deobfuscate(source)
+    if NODE:
+        assert run_node(code) == run_node(source)
+    if "_0x1a=" in source:
+        # 数组与函数定义保留，调用未被替换为字符串
+        assert "_0x1a=['alpha','beta','gamma']" in code
+        assert "_0x2b(" in code.split("}", 1)[1]
+
+
+def test_unary_plus_concat_not_folded(deobfuscator):
+    code, _ = deobfuscator.deobfuscate("var y = +'1' + '2';")
+    assert code == "var y = +'1' + '2';"
+
+
+def test_negated_array_member_not_folded(deobfuscator):
+    code, _ = deobfuscator.deobfuscate("x = ![].length; y = ![];")
+    assert code == "x = ![].length; y = false;"
+
+
+def test_keyword_property_not_fold_boundary(deobfuscator):
+    source = "var r = o.return + 1 * 2; var s = o?.case + 'a' + 'b'; var t = o.return / 2 / 1;"
+    code, _ = deobfuscator.deobfuscate(source)
+    assert code == source
+
+
+def test_collapsed_input_keeps_code_after_line_comment(deobfuscator):
+    # -u 路径拼接脚本后压缩空白，// 注释会吞掉整行剩余内容
+    source = re.sub(r"\s+", " ", "// init helper\nvar a = 1;\nvar key = CryptoJS.AES.encrypt('x', 'k');")
+    code, stats = deobfuscator.deobfuscate(source)
+    assert stats["status"] == "ok"
+    assert "CryptoJS.AES.encrypt" in code
+
+
+def test_budget_exceeded_returns_code(deobfuscator):
+    source = (FIXTURE_DIR / "obfuscator_io_base64.js").read_text(encoding="utf-8")
+    code, stats = Deobfuscator({"time_budget": 0}).deobfuscate(source)
+    assert stats["status"] == "budget_exceeded"
+    assert code == source
+
+
+def test_oversized_script_skipped():
+    code, stats = Deobfuscator({"max_script_size": 10}).deobfuscate("var a = 0x1 + 0x2;")
+    assert stats["status"] == "skipped"
+    assert code == "var a = 0x1 + 0x2;"
+
+
+def test_merge_stats_sums_scripts(deobfuscator):
+    sources = [(FIXTURE_DIR / "obfuscator_io_base64.js").read_text(encoding="utf-8"), "var a = 1;"]
+    stats_list = [deobfuscator.deobfuscate(code)[1] for code in sources]
+    stats_list.append(Deobfuscator({"max_script_size": 1}).deobfuscate("var b = 2;")[1])
+    merged = Deobfuscator.merge_stats(stats_list)
+    assert merged["scripts"] == 3
+    assert merged["status"] == {"ok": 2, "skipped": 1}
+    assert merged["original_length"] == sum(s["original_length"] for s in stats_list)
+    assert merged["strings_decoded"] == stats_list[0]["strings_decoded"] > 0
@@ -0,0 +1,182 @@
+import pytest
+
+requests = pytest.importorskip("requests")
+pytest.importorskip("bs4")
+
+from core.change_monitor import ChangeMonitor, SnapshotStore
+from core.deobfuscator import Deobfuscator
+from core.web_crawler import JSExtractor
+
+PAGE_URL = "http://example.test/index.html"
+APP_URL = "http://example.test/static/app.js"
+SIGN_URL = "http://example.test/static/sign.js"
+PAGE = (
+    "<html><head><script>var token = 'abc';</script>"
+    f"<script src='{APP_URL}'></script><script src='{SIGN_URL}'></script>"
+    "</head><body><script>init();</script></body></html>"
+)
+
+
+def make_response(url, status=200, text="", content_type="application/javascript", **headers):
+    resp = requests.Response()
+    resp.status_code = status
+    resp.url = url
+    resp._content = text.encode("utf-8")
+    resp.encoding = "utf-8"
+    resp.headers.update({"Content-Type": content_type, **headers})
+    return resp
+
+
+class FakeSession:
+    """按 URL 返回预设响应，并记录每次请求携带的请求头"""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = {}
+
+    def get(self, url, headers=None, **kwargs):
+        self.requests.setdefault(url, []).append(headers or {})
+        response = self.responses[url]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def extractor(monkeypatch):
+    monkeypatch.setattr("core.web_crawler.sleep", lambda seconds: None)
+    return JSExtractor()
+
+
+def html_response(text=PAGE, **headers):
+    return make_response(PAGE_URL, text=text, content_type="text/html", **headers)
+
+
+def first_scan(extractor):
+    extractor.session = FakeSession({
+        PAGE_URL: html_response(ETag='"page-v1"'),
+        APP_URL: make_response(APP_URL, text="var app = 1;", ETag='"app-v1"'),
+        SIGN_URL: make_response(SIGN_URL, text="var sign = 2;", **{"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+    })
+    snapshot, changed = extractor.extract_changes(PAGE_URL, {})
+    for sid in changed:
+        snapshot["scripts"][sid]["findings"] = [f"hash/{sid}"]
+    snapshot.pop("stats")
+    return snapshot, changed
+
+
+def test_first_scan_records_all_scripts(extractor):
+    snapshot, changed = first_scan(extractor)
+    assert set(changed) == {"inline:0", "inline:1", APP_URL, SIGN_URL}
+    assert changed["inline:0"] == "var token = 'abc';"
+    assert snapshot["page"]["etag"] == '"page-v1"'
+    assert snapshot["page"]["script_urls"] == [APP_URL, SIGN_URL]
+    assert snapshot["scripts"][APP_URL]["etag"] == '"app-v1"'
+    assert snapshot["scripts"][SIGN_URL]["last_modified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+def test_page_not_modified_reuses_script_urls(extractor):
+    snapshot, _ = first_scan(extractor)
+    # 上次获取失败的脚本不在 scripts 中，但仍应被重新请求
+    del snapshot["scripts"][SIGN_URL]
+    extractor.session = FakeSession({
+        PAGE_URL: make_response(PAGE_URL, status=304),
+        APP_URL: make_response(APP_URL, status=304),
+        SIGN_URL: make_response(SIGN_URL, text="var sign = 2;"),
+    })
+    new_snapshot, changed = extractor.extract_changes(PAGE_URL, snapshot)
+    assert extractor.session.requests[PAGE_URL][0]["If-None-Match"] == '"page-v1"'
+    assert list(changed) == [SIGN_URL]
+    assert new_snapshot["page"] == snapshot["page"]
+    assert new_snapshot["scripts"]["inline:0"] == snapshot["scripts"]["inline:0"]
+    assert new_snapshot["stats"] == {"not_modified": 2, "downloaded": 1}
+
+
+def test_script_not_modified_keeps_entry(extractor):
+    snapshot, _ = first_scan(extractor)
+    extractor.session = FakeSession({
+        PAGE_URL: html_response(ETag='"page-v1"'),
+        APP_URL: make_response(APP_URL, status=304),
+        SIGN_URL: make_response(SIGN_URL, status=304),
+    })
+    new_snapshot, changed = extractor.extract_changes(PAGE_URL, snapshot)
+    assert changed == {}
+    assert extractor.session.requests[APP_URL][0]["If-None-Match"] == '"app-v1"'
+    assert extractor.session.requests[SIGN_URL][0]["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert new_snapshot["scripts"] == snapshot["scripts"]
+
+
+def test_same_hash_keeps_findings(extractor):
+    snapshot, _ = first_scan(extractor)
+    # 服务端忽略条件请求，返回 200 但内容未变
+    extractor.session = FakeSession({
+        PAGE_URL: html_response(),
+        APP_URL: make_response(APP_URL, text="var app = 1;"),
+        SIGN_URL: make_response(SIGN_URL, text="var sign = 2;"),
+    })
+    new_snapshot, changed = extractor.extract_changes(PAGE_URL, snapshot)
+    assert changed == {}
+    assert new_snapshot["scripts"][APP_URL]["findings"] == [f"hash/{APP_URL}"]
+    assert new_snapshot["scripts"]["inline:1"]["findings"] == ["hash/inline:1"]
+
+
+@pytest.mark.parametrize("failure", [
+    make_response(SIGN_URL, text="   "),
+    make_response(SIGN_URL, text="<html></html>", content_type="text/html"),
+    requests.exceptions.ConnectionError("connection reset"),
+], ids=["empty_body", "wrong_content_type", "connection_error"])
+def test_failed_fetch_keeps_old_entry(extractor, failure):
+    snapshot, _ = first_scan(extractor)
+    extractor.session = FakeSession({
+        PAGE_URL: html_response(),
+        APP_URL: make_response(APP_URL, status=304),
+        SIGN_URL: failure,
+    })
+    new_snapshot, changed = extractor.extract_changes(PAGE_URL, snapshot)
+    assert changed == {}
+    assert new_snapshot["scripts"][SIGN_URL] == snapshot["scripts"][SIGN_URL]
+
+
+def test_changed_and_removed_scripts(extractor):
+    snapshot, _ = first_scan(extractor)
+    page = PAGE.replace("var token = 'abc';", "var token = 'xyz';").replace(f"<script src='{SIGN_URL}'></script>", "")
+    extractor.session = FakeSession({
+        PAGE_URL: html_response(text=page),
+        APP_URL: make_response(APP_URL, text="var app = 3;"),
+    })
+    new_snapshot, changed = extractor.extract_changes(PAGE_URL, snapshot)
+    # 内联脚本按位置标识，内容变化不会表现为删除+新增
+    assert set(changed) == {"inline:0", APP_URL}
+    assert set(new_snapshot["scripts"]) == {"inline:0", "inline:1", APP_URL}
+    assert "findings" not in new_snapshot["scripts"][APP_URL]
+
+
+class RecordingAnalyzer:
+    def __init__(self):
+        self.deobfuscator = Deobfuscator()
+        self.calls = 0
+
+    def _match_local_features(self, code):
+        return []
+
+    def analyze_code(self, code, deobfuscate=True):
+        self.calls += 1
+        return {"errors": []}
+
+
+def test_monitor_unchanged_site_makes_no_ai_call(extractor, tmp_path):
+    analyzer = RecordingAnalyzer()
+    monitor = ChangeMonitor(extractor, analyzer, SnapshotStore(tmp_path))
+    first_scan(extractor)
+    monitor.run(PAGE_URL)
+    assert analyzer.calls == 1
+    extractor.session = FakeSession({
+        PAGE_URL: make_response(PAGE_URL, status=304),
+        APP_URL: make_response(APP_URL, status=304),
+        SIGN_URL: make_response(SIGN_URL, status=304),
+    })
+    report = monitor.run(PAGE_URL)
+    assert analyzer.calls == 1
+    assert report["ai_analysis"] is None
+    assert report["requests"] == {"not_modified": 3, "downloaded": 0}
+    assert report["new_scripts"] == report["removed_scripts"] == report["changed_scripts"] == []